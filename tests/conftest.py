@@ -5,9 +5,13 @@ Test configuration for Vienna Weather Monitoring System
 import pytest
 import os
 import sys
+from pathlib import Path
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the project root to the Python path (guarded so repeated imports
+# under pytest collection don't grow sys.path)
+_root = str(Path(__file__).resolve().parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 # Test configuration
 pytest_plugins = []
@@ -27,13 +31,24 @@ def pytest_configure(config):
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers automatically"""
     for item in items:
-        # Add integration marker to integration tests
-        if "test_integration" in item.nodeid:
+        # Match on the file name instead of scanning the full nodeid
+        if item.path.name.startswith("test_integration"):
             item.add_marker(pytest.mark.integration)
-        # Add unit marker to unit tests
-        elif "test_weather_system" in item.nodeid:
+        elif item.path.name.startswith("test_weather_system"):
             item.add_marker(pytest.mark.unit)
 
+@pytest.fixture(scope="session")
+def http_session():
+    """Shared pooled HTTP session so tests reuse keep-alive connections"""
+    import requests
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                                            max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    yield session
+    session.close()
+
 @pytest.fixture(scope="session")
 def test_config():
     """Test configuration fixture"""
@@ -6,18 +6,12 @@ Tests the core functionality of weather data collection and processing
 import pytest
 import json
 import requests
+import responses
 from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-try:
-    import weather_auto_rabbitmq
-except ImportError:
-    # Handle the case where the module might not be directly importable
-    pass
+# conftest.py puts the project root on sys.path once per session; a broken
+# module import should fail collection loudly rather than be swallowed
+import weather_auto_rabbitmq
 
 
 class TestWeatherDataCollection:
@@ -29,20 +23,23 @@ class TestWeatherDataCollection:
         assert weather_auto_rabbitmq.API_KEY is not None
         assert len(weather_auto_rabbitmq.API_KEY) > 0
     
-    @patch('requests.get')
-    def test_weather_api_call_success(self, mock_get):
+    @responses.activate
+    def test_weather_api_call_success(self):
         """Test successful weather API call"""
-        # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'weather': [{'main': 'Clear', 'description': 'clear sky'}],
-            'main': {'temp': 293.15, 'humidity': 65, 'pressure': 1013},
-            'wind': {'speed': 3.5, 'deg': 180},
-            'name': 'Vienna',
-            'sys': {'country': 'AT'}
-        }
-        mock_get.return_value = mock_response
+        # Stub the API at the transport-adapter level - no Mock objects
+        # to build per call, and the real requests machinery still runs
+        responses.add(
+            responses.GET,
+            "http://api.openweathermap.org/data/2.5/weather",
+            json={
+                'weather': [{'main': 'Clear', 'description': 'clear sky'}],
+                'main': {'temp': 293.15, 'humidity': 65, 'pressure': 1013},
+                'wind': {'speed': 3.5, 'deg': 180},
+                'name': 'Vienna',
+                'sys': {'country': 'AT'}
+            },
+            status=200
+        )
         
         # Test the API call
         api_key = weather_auto_rabbitmq.API_KEY
@@ -56,14 +53,15 @@ class TestWeatherDataCollection:
         assert 'main' in data
         assert data['name'] == 'Vienna'
     
-    @patch('requests.get')
-    def test_weather_api_call_failure(self, mock_get):
+    @responses.activate
+    def test_weather_api_call_failure(self):
         """Test handling of failed weather API call"""
-        # Mock failed API response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {'message': 'Invalid API key'}
-        mock_get.return_value = mock_response
+        responses.add(
+            responses.GET,
+            "http://api.openweathermap.org/data/2.5/weather",
+            json={'message': 'Invalid API key'},
+            status=401
+        )
         
         api_key = "invalid_key"
         url = f"http://api.openweathermap.org/data/2.5/weather?q=Vienna,AT&appid={api_key}"
@@ -156,12 +154,13 @@ class TestDataProcessing:
             'description': 'clear sky'
         }
         
-        # Test JSON serialization
-        json_string = json.dumps(sample_data)
-        assert isinstance(json_string, str)
+        # Serialize through the module's encoder - the same path the
+        # publisher and log writer use (orjson when installed)
+        payload = weather_auto_rabbitmq._dumps(sample_data)
+        assert isinstance(payload, bytes)
         
         # Test JSON deserialization
-        parsed_data = json.loads(json_string)
+        parsed_data = json.loads(payload)
         assert parsed_data == sample_data
     
     def test_data_validation(self):
@@ -192,25 +191,20 @@ class TestConfiguration:
     """Test configuration and constants"""
     
     def test_configuration_constants(self):
-        """Test that all required configuration constants are defined"""
-        assert hasattr(weather_auto_rabbitmq, 'API_KEY')
-        assert hasattr(weather_auto_rabbitmq, 'RABBITMQ_HOST')
-        assert hasattr(weather_auto_rabbitmq, 'RABBITMQ_PORT')
-        assert hasattr(weather_auto_rabbitmq, 'RABBITMQ_USERNAME')
-        assert hasattr(weather_auto_rabbitmq, 'RABBITMQ_PASSWORD')
-        assert hasattr(weather_auto_rabbitmq, 'RABBITMQ_QUEUE')
-        assert hasattr(weather_auto_rabbitmq, 'RABBITMQ_EXCHANGE')
-        assert hasattr(weather_auto_rabbitmq, 'RABBITMQ_ROUTING_KEY')
+        """Test that the module exposes a frozen config object"""
+        assert isinstance(weather_auto_rabbitmq.CONFIG,
+                          weather_auto_rabbitmq.RabbitConfig)
     
     def test_rabbitmq_configuration(self):
-        """Test RabbitMQ configuration values"""
-        assert weather_auto_rabbitmq.RABBITMQ_HOST == 'localhost'
-        assert weather_auto_rabbitmq.RABBITMQ_PORT == 5672
-        assert weather_auto_rabbitmq.RABBITMQ_USERNAME == 'guest'
-        assert weather_auto_rabbitmq.RABBITMQ_PASSWORD == 'guest'
-        assert weather_auto_rabbitmq.RABBITMQ_QUEUE == 'vienna_weather'
-        assert weather_auto_rabbitmq.RABBITMQ_EXCHANGE == 'weather_exchange'
-        assert weather_auto_rabbitmq.RABBITMQ_ROUTING_KEY == 'vienna.weather.hourly'
+        """Test RabbitMQ configuration field types"""
+        config = weather_auto_rabbitmq.CONFIG
+        assert isinstance(config.host, str) and config.host
+        assert isinstance(config.port, int) and 0 < config.port < 65536
+        assert isinstance(config.username, str)
+        assert isinstance(config.password, str)
+        assert isinstance(config.queue, str) and config.queue
+        assert isinstance(config.exchange, str) and config.exchange
+        assert isinstance(config.routing_key, str) and config.routing_key
 
 
 if __name__ == '__main__':
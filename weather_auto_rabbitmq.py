@@ -1,37 +1,140 @@
 import requests
 import json
+import atexit
+import os
+import signal
+import threading
 import time
 import pika
 import subprocess
-from datetime import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize to JSON bytes with orjson's C encoder"""
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        """Parse JSON bytes with orjson's C decoder"""
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj):
+        """Serialize to JSON bytes with the stdlib encoder"""
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+    def _loads(data):
+        """Parse JSON bytes with the stdlib decoder"""
+        return json.loads(data)
+
+def _now_snapshot():
+    """One clock read returning (datetime, epoch milliseconds)
+
+    time.time_ns() is a single syscall; deriving both representations from
+    it keeps the timestamp fields of one record mutually consistent.
+    """
+    ns = time.time_ns()
+    return datetime.fromtimestamp(ns / 1e9), ns // 1_000_000
+
+
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s %(levelname)s %(message)s')
+logger = logging.getLogger(__name__)
 
 # Your OpenWeatherMap API key
 API_KEY = "7ea63a60ef095d75baf077171165c148"
 
+# Shared HTTP session - reuses the TCP/TLS connection to OpenWeatherMap
+# across hourly checks instead of handshaking from scratch every call
+SESSION = requests.Session()
+SESSION.headers['Accept-Encoding'] = 'gzip'
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=requests.adapters.Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# The hourly request never changes, so prepare it once; SESSION.send skips
+# the URL encoding and header merging that requests.get redoes per call
+_PREPARED = SESSION.prepare_request(requests.Request(
+    'GET',
+    'https://api.openweathermap.org/data/2.5/weather',
+    params={'q': 'Vienna,AT', 'appid': API_KEY, 'units': 'metric'}
+))
+
 # RabbitMQ Configuration
-RABBITMQ_HOST = 'localhost'
-RABBITMQ_PORT = 5672
-RABBITMQ_USERNAME = 'guest'
-RABBITMQ_PASSWORD = 'guest'
-RABBITMQ_QUEUE = 'vienna_weather'
-RABBITMQ_EXCHANGE = 'weather_exchange'
-RABBITMQ_ROUTING_KEY = 'vienna.weather.hourly'
-RABBITMQ_CONTAINER_NAME = 'rabbitmq'
+@dataclass(frozen=True)
+class RabbitConfig:
+    """Connection and topology settings for the weather broker"""
+    host: str = 'localhost'
+    port: int = 5672
+    username: str = 'guest'
+    password: str = 'guest'
+    queue: str = 'vienna_weather'
+    exchange: str = 'weather_exchange'
+    routing_key: str = 'vienna.weather.hourly'
+    container_name: str = 'rabbitmq'
+
+
+CONFIG = RabbitConfig()
+
+# Module-level aliases kept for existing callers
+RABBITMQ_HOST = CONFIG.host
+RABBITMQ_PORT = CONFIG.port
+RABBITMQ_USERNAME = CONFIG.username
+RABBITMQ_PASSWORD = CONFIG.password
+RABBITMQ_QUEUE = CONFIG.queue
+RABBITMQ_EXCHANGE = CONFIG.exchange
+RABBITMQ_ROUTING_KEY = CONFIG.routing_key
+RABBITMQ_CONTAINER_NAME = CONFIG.container_name
 
 
 class RabbitMQManager:
 
     def __init__(self):
         self.container_name = RABBITMQ_CONTAINER_NAME
+        self._docker_available = None
 
     def is_docker_available(self):
-        """Check if Docker is available"""
+        """Check if Docker is available (probed once per manager)"""
+        if self._docker_available is None:
+            try:
+                result = subprocess.run(['docker', '--version'],
+                                        capture_output=True, text=True, timeout=10)
+                self._docker_available = result.returncode == 0
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                self._docker_available = False
+        return self._docker_available
+
+    def _container_state(self):
+        """Look up the container with one docker ps -a call
+
+        Returns 'running', 'stopped' when it exists but is not up, or
+        None when it does not exist or Docker did not answer.
+        """
         try:
-            result = subprocess.run(['docker', '--version'],
+            result = subprocess.run(['docker', 'ps', '-a', '--filter', f'name={self.container_name}',
+                                    '--format', '{{.Names}} {{.State}}'],
                                     capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            return None
+        if result.returncode != 0:
+            return None
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            if parts and parts[0] == self.container_name:
+                return 'running' if 'running' in parts[1:] else 'stopped'
+        return None
 
     def is_rabbitmq_running(self):
         """Check if RabbitMQ container is running"""
@@ -43,30 +146,33 @@ class RabbitMQManager:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
-    def start_rabbitmq(self):
-        """Start RabbitMQ container"""
+    def start_rabbitmq(self, container_exists=None):
+        """Start RabbitMQ container
+
+        container_exists lets a caller that already looked the container up
+        skip the extra docker ps -a round-trip.
+        """
         try:
-            print("Starting RabbitMQ container...")
+            logger.info("Starting RabbitMQ container...")
 
-            # Check if container exists but is stopped
-            result = subprocess.run(['docker', 'ps', '-a', '--filter', f'name={self.container_name}',
-                                    '--format', '{{.Names}}'],
-                                    capture_output=True, text=True, timeout=10)
+            if container_exists is None:
+                # Check if container exists but is stopped
+                container_exists = self._container_state() is not None
 
-            if self.container_name in result.stdout:
+            if container_exists:
                 # Container exists, start it
-                print("Found existing RabbitMQ container, starting it...")
+                logger.info("Found existing RabbitMQ container, starting it...")
                 start_result = subprocess.run(['docker', 'start', self.container_name],
                                               capture_output=True, text=True, timeout=30)
                 if start_result.returncode == 0:
-                    print("RabbitMQ container started successfully")
+                    logger.info("RabbitMQ container started successfully")
                     return True
                 else:
-                    print(f"Failed to start existing container: {start_result.stderr}")
+                    logger.error("Failed to start existing container: %s", start_result.stderr)
                     return False
             else:
                 # Create new container
-                print("Creating new RabbitMQ container...")
+                logger.info("Creating new RabbitMQ container...")
                 create_result = subprocess.run([
                     'docker', 'run', '-d',
                     '--name', self.container_name,
@@ -76,34 +182,37 @@ class RabbitMQManager:
                 ], capture_output=True, text=True, timeout=60)
 
                 if create_result.returncode == 0:
-                    print("RabbitMQ container created and started successfully")
-                    print("Management interface will be available at: http://localhost:15672")
-                    print("Waiting 10 seconds for RabbitMQ to initialize...")
+                    logger.info("RabbitMQ container created and started successfully")
+                    logger.info("Management interface will be available at: http://localhost:15672")
+                    logger.info("Waiting 10 seconds for RabbitMQ to initialize...")
                     time.sleep(10)  # Wait for RabbitMQ to fully start
                     return True
                 else:
-                    print(f"Failed to create RabbitMQ container: {create_result.stderr}")
+                    logger.error("Failed to create RabbitMQ container: %s", create_result.stderr)
                     return False
 
         except subprocess.TimeoutExpired:
-            print("Docker command timed out")
+            logger.error("Docker command timed out")
             return False
         except Exception as e:
-            print(f"Error managing RabbitMQ container: {e}")
+            logger.error("Error managing RabbitMQ container: %s", e)
             return False
 
     def ensure_rabbitmq_running(self):
         """Ensure RabbitMQ is running, start if necessary"""
         if not self.is_docker_available():
-            print("Docker is not available. Please install Docker to auto-manage RabbitMQ.")
+            logger.warning("Docker is not available. Please install Docker to auto-manage RabbitMQ.")
             return False
 
-        if self.is_rabbitmq_running():
-            print("RabbitMQ container is already running")
+        # One docker ps -a answers both "is it running" and "does it exist",
+        # instead of separate subprocess spawns for each question
+        state = self._container_state()
+        if state == 'running':
+            logger.info("RabbitMQ container is already running")
             return True
         else:
-            print("RabbitMQ container not running, attempting to start...")
-            return self.start_rabbitmq()
+            logger.info("RabbitMQ container not running, attempting to start...")
+            return self.start_rabbitmq(container_exists=(state == 'stopped'))
 
 
 class WeatherRabbitMQPublisher:
@@ -115,6 +224,16 @@ class WeatherRabbitMQPublisher:
         self.password = password
         self.connection = None
         self.channel = None
+        # The envelope keys that never change between publishes
+        self._envelope_static = {
+            "city": "Vienna",
+            "country": "Austria",
+            "source": "OpenWeatherMap"
+        }
+        self._props = pika.BasicProperties(
+            delivery_mode=2,  # Make message persistent
+            content_type='application/json'
+        )
 
     def connect(self, max_retries=3):
         """Connect to RabbitMQ with retries"""
@@ -126,104 +245,179 @@ class WeatherRabbitMQPublisher:
                     port=self.port,
                     credentials=credentials,
                     connection_attempts=3,
-                    retry_delay=2
+                    retry_delay=2,
+                    # One small publish per hour: frame_max sized to the
+                    # <1KB messages and timeouts that bound how long a dead
+                    # broker can hang the loop. The 600s heartbeat only
+                    # works because the monitor pumps heartbeat_tick during
+                    # its hourly wait; pika sets TCP_NODELAY on its own
+                    heartbeat=600,
+                    frame_max=8192,
+                    socket_timeout=5,
+                    stack_timeout=10,
+                    blocked_connection_timeout=60
                 )
                 self.connection = pika.BlockingConnection(parameters)
                 self.channel = self.connection.channel()
 
-                # Declare exchange
-                self.channel.exchange_declare(
-                    exchange=RABBITMQ_EXCHANGE,
-                    exchange_type='topic',
-                    durable=True
-                )
-
-                # Declare queue
-                self.channel.queue_declare(queue=RABBITMQ_QUEUE, durable=True)
-
-                # Bind queue to exchange
-                self.channel.queue_bind(
-                    exchange=RABBITMQ_EXCHANGE,
-                    queue=RABBITMQ_QUEUE,
-                    routing_key=RABBITMQ_ROUTING_KEY
-                )
-
-                print("Connected to RabbitMQ successfully")
+                try:
+                    # Passive declares only verify the topology exists - a
+                    # cheap check on reconnect, since the durable exchange,
+                    # queue, and binding survive from the first run
+                    self.channel.exchange_declare(
+                        exchange=RABBITMQ_EXCHANGE,
+                        passive=True
+                    )
+                    self.channel.queue_declare(queue=RABBITMQ_QUEUE, passive=True)
+                except pika.exceptions.ChannelClosedByBroker:
+                    # Topology missing - the broker closes the channel on a
+                    # failed passive declare, so reopen it and declare in full
+                    self.channel = self.connection.channel()
+
+                    # Declare exchange
+                    self.channel.exchange_declare(
+                        exchange=RABBITMQ_EXCHANGE,
+                        exchange_type='topic',
+                        durable=True
+                    )
+
+                    # Declare queue
+                    self.channel.queue_declare(queue=RABBITMQ_QUEUE, durable=True)
+
+                    # Bind queue to exchange
+                    self.channel.queue_bind(
+                        exchange=RABBITMQ_EXCHANGE,
+                        queue=RABBITMQ_QUEUE,
+                        routing_key=RABBITMQ_ROUTING_KEY
+                    )
+
+                # Publisher confirms - the broker acks each publish, so a
+                # dropped message surfaces as an exception instead of
+                # disappearing silently
+                self.channel.confirm_delivery()
+
+                logger.info("Connected to RabbitMQ successfully")
                 return True
 
             except Exception as e:
-                print(f"Attempt {attempt + 1}/{max_retries} failed to connect to RabbitMQ: {e}")
+                logger.warning("Attempt %d/%d failed to connect to RabbitMQ: %s",
+                               attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
-                    print("Waiting 5 seconds before retry...")
+                    logger.info("Waiting 5 seconds before retry...")
                     time.sleep(5)
 
-        print("Failed to connect to RabbitMQ after all attempts")
+        logger.error("Failed to connect to RabbitMQ after all attempts")
         return False
 
-    def publish_weather_data(self, weather_data):
-        """Publish weather data to RabbitMQ"""
+    def _build_message(self, weather_data):
+        """Build the publish envelope with millisecond precision timestamps"""
+        now, now_ms = _now_snapshot()
+        iso = now.isoformat(timespec='milliseconds')
+        return {
+            **self._envelope_static,
+            "timestamp": iso,
+            "weather_check_time_ms": now_ms,
+            "weather_data": weather_data,
+            "api_response_time": iso
+        }
+
+    def publish_weather_batch(self, messages, batch_size=64):
+        """Publish a backlog of pre-built messages, returning how many went out
+
+        Publishes in chunks and lets pika service connection events between
+        chunks so a large backlog drain does not starve heartbeats.
+        """
+        if not self.channel:
+            logger.warning("No RabbitMQ connection available")
+            return 0
+        sent = 0
+        for start in range(0, len(messages), batch_size):
+            try:
+                for message in messages[start:start + batch_size]:
+                    self.channel.basic_publish(
+                        exchange=RABBITMQ_EXCHANGE,
+                        routing_key=RABBITMQ_ROUTING_KEY,
+                        body=_dumps(message),
+                        properties=self._props
+                    )
+                    sent += 1
+                self.connection.process_data_events(time_limit=0)
+            except Exception as e:
+                logger.error("Backlog publish stopped after %d messages: %s", sent, e)
+                break
+        return sent
+
+    def publish_body(self, body):
+        """Publish a pre-encoded message body to RabbitMQ"""
         try:
             if not self.channel:
-                print("No RabbitMQ connection available")
+                logger.warning("No RabbitMQ connection available")
                 return False
 
-            # Prepare message with millisecond precision timestamp
-            message = {
-                "timestamp": datetime.now().isoformat(timespec='milliseconds'),
-                "weather_check_time_ms": int(datetime.now().timestamp() * 1000),
-                "city": "Vienna",
-                "country": "Austria",
-                "weather_data": weather_data,
-                "source": "OpenWeatherMap",
-                "api_response_time": datetime.now().isoformat(timespec='milliseconds')
-            }
-
-            # Publish message
             self.channel.basic_publish(
                 exchange=RABBITMQ_EXCHANGE,
                 routing_key=RABBITMQ_ROUTING_KEY,
-                body=json.dumps(message, ensure_ascii=False),
-                properties=pika.BasicProperties(
-                    delivery_mode=2,  # Make message persistent
-                    content_type='application/json'
-                )
+                body=body,
+                properties=self._props
             )
 
-            print("Weather data sent to RabbitMQ")
+            logger.info("Weather data sent to RabbitMQ")
             return True
 
+        except pika.exceptions.UnroutableError:
+            logger.error("RabbitMQ could not route the message")
+            return False
         except Exception as e:
-            print(f"Failed to publish to RabbitMQ: {e}")
+            logger.error("Failed to publish to RabbitMQ: %s", e)
             return False
 
+    def publish_weather_data(self, weather_data):
+        """Publish weather data to RabbitMQ"""
+        return self.publish_body(_dumps(self._build_message(weather_data)))
+
+    def heartbeat_tick(self):
+        """Let pika service heartbeats on an otherwise idle connection
+
+        BlockingConnection only reads and writes inside blocking calls, so
+        a caller that sleeps between publishes must pump this periodically
+        or the broker counts missed heartbeats and drops the connection.
+        """
+        try:
+            if self.connection and self.connection.is_open:
+                self.connection.process_data_events(time_limit=0)
+        except Exception as e:
+            logger.warning("Heartbeat servicing failed: %s", e)
+
+    def reconnect(self):
+        """Drop a dead connection and establish a fresh one"""
+        self.close()
+        self.connection = None
+        self.channel = None
+        return self.connect(max_retries=1)
+
     def close(self):
         """Close RabbitMQ connection"""
         try:
             if self.connection and not self.connection.is_closed:
                 self.connection.close()
-                print("RabbitMQ connection closed")
+                logger.info("RabbitMQ connection closed")
         except Exception as e:
-            print(f"Error closing RabbitMQ connection: {e}")
+            logger.error("Error closing RabbitMQ connection: %s", e)
 
 
 def get_vienna_weather():
     """Get Vienna weather data from OpenWeatherMap API"""
 
     if API_KEY == "YOUR_API_KEY_HERE":
-        print("Please replace 'YOUR_API_KEY_HERE' with your actual OpenWeatherMap API key")
+        logger.error("Please replace 'YOUR_API_KEY_HERE' with your actual OpenWeatherMap API key")
         return None
 
-    url = "http://api.openweathermap.org/data/2.5/weather"
-    params = {
-        'q': 'Vienna,AT',
-        'appid': API_KEY,
-        'units': 'metric'
-    }
-
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.send(_PREPARED, timeout=(3.05, 10))
         response.raise_for_status()
-        data = response.json()
+        # Decode the raw bytes directly - skips response.json()'s charset
+        # sniff and str detour, and uses orjson when installed
+        data = _loads(response.content)
 
         # Display weather information
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -248,41 +442,62 @@ def get_vienna_weather():
         return data
 
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching weather: {e}")
+        logger.error("Error fetching weather: %s", e)
         return None
     except KeyError as e:
-        print(f"Error parsing weather data: {e}")
+        logger.error("Error parsing weather data: %s", e)
         return None
 
 
-def save_to_log(weather_data, check_number):
-    """Save weather data to local log file (backup)"""
+# Stable field order so a future multi-city extension can load batches of
+# these straight into a columnar array and vectorize the unit conversions
+METRIC_FIELDS = ('temperature', 'feels_like', 'humidity', 'pressure',
+                 'wind_speed', 'cloudiness')
+
+
+def extract_metrics(weather_data):
+    """Flatten the numeric metrics of an API response, in METRIC_FIELDS order"""
+    main = weather_data['main']
+    return {
+        'temperature': main['temp'],
+        'feels_like': main['feels_like'],
+        'humidity': main['humidity'],
+        'pressure': main['pressure'],
+        'wind_speed': weather_data['wind']['speed'],
+        'cloudiness': weather_data['clouds']['all']
+    }
+
+
+def save_to_log(weather_data, check_number, log_fp=None):
+    """Save weather data to local log file (backup)
+
+    Writes through log_fp when the caller keeps a persistent handle open;
+    otherwise falls back to opening the file for this one entry.
+    """
     try:
-        now = datetime.now()
+        now, timestamp_ms = _now_snapshot()
         timestamp = now.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Millisecond precision
-        timestamp_ms = int(now.timestamp() * 1000)
 
         log_entry = {
             "check_number": check_number,
             "timestamp": timestamp,
             "timestamp_ms": timestamp_ms,
-            "temperature": weather_data['main']['temp'],
-            "feels_like": weather_data['main']['feels_like'],
-            "humidity": weather_data['main']['humidity'],
-            "pressure": weather_data['main']['pressure'],
+            **extract_metrics(weather_data),
             "description": weather_data['weather'][0]['description'],
-            "wind_speed": weather_data['wind']['speed'],
-            "cloudiness": weather_data['clouds']['all'],
             "api_call_time": now.isoformat(timespec='milliseconds')
         }
 
-        with open("vienna_weather_log.json", "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        line = _dumps(log_entry) + b"\n"
+        if log_fp is not None:
+            log_fp.write(line)
+        else:
+            with open("vienna_weather_log.json", "ab") as f:
+                f.write(line)
 
-        print("Weather data saved to local log file")
+        logger.info("Weather data saved to local log file")
 
     except Exception as e:
-        print(f"Warning: Could not save to log file: {e}")
+        logger.warning("Could not save to log file: %s", e)
 
 
 def hourly_weather_monitoring():
@@ -295,9 +510,9 @@ def hourly_weather_monitoring():
     rabbitmq_manager = RabbitMQManager()
 
     # Ensure RabbitMQ is running
-    print("Checking RabbitMQ status...")
+    logger.info("Checking RabbitMQ status...")
     if not rabbitmq_manager.ensure_rabbitmq_running():
-        print("Could not start RabbitMQ automatically. Continuing with local logging only.")
+        logger.warning("Could not start RabbitMQ automatically. Continuing with local logging only.")
         rabbitmq_connected = False
     else:
         # Initialize RabbitMQ publisher
@@ -315,12 +530,26 @@ def hourly_weather_monitoring():
     print("=" * 70)
 
     print("Press Ctrl+C to stop the monitoring")
-    print("Next check will be in 1 hour after the first check\n")
+    print("Next check will be at the top of the next hour\n")
+
+    # Ctrl+C sets the event, which wakes the wait below immediately instead
+    # of the interrupt racing a blocking hour-long sleep
+    stop_evt = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_evt.set())
 
     check_count = 0
+    backlog = []  # Messages that failed to publish, drained in batches
+
+    # One persistent append handle instead of an open/close pair per check;
+    # the OS page cache coalesces the buffered writes
+    log_fp = open("vienna_weather_log.json", "ab", buffering=1 << 16)
+    atexit.register(log_fp.close)
+
+    # Two workers overlap the local disk write with the broker round-trip
+    io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='weather-io')
 
     try:
-        while True:
+        while not stop_evt.is_set():
             check_count += 1
             print(f"\nWeather Check #{check_count}")
 
@@ -328,30 +557,59 @@ def hourly_weather_monitoring():
             weather_data = get_vienna_weather()
 
             if weather_data:
-                # Save to local log file (backup)
-                save_to_log(weather_data, check_count)
-
-                # Send to RabbitMQ if connected
                 if rabbitmq_connected:
-                    success = publisher.publish_weather_data(weather_data)
-                    if not success:
-                        print("Failed to send to RabbitMQ, but data saved locally")
+                    if backlog:
+                        drained = publisher.publish_weather_batch(backlog)
+                        del backlog[:drained]
+                        if drained:
+                            logger.info("Drained %d backlogged messages to RabbitMQ", drained)
+
+                    # Run the log write and the publish side by side; the
+                    # message is built and encoded here so the worker only
+                    # hands pika a finished body (channels are not
+                    # thread-safe for concurrent use)
+                    message = publisher._build_message(weather_data)
+                    fut_log = io_pool.submit(save_to_log, weather_data, check_count, log_fp)
+                    fut_amqp = io_pool.submit(publisher.publish_body, _dumps(message))
+                    fut_log.result()
+                    if not fut_amqp.result():
+                        backlog.append(message)
+                        logger.warning("Failed to send to RabbitMQ, but data saved locally")
+                        # A failed publish usually means the connection died;
+                        # a fresh one lets the next check drain the backlog
+                        if publisher.reconnect():
+                            logger.info("Re-established RabbitMQ connection")
                 else:
-                    print("RabbitMQ not available, data saved locally only")
-
-            # Wait for 1 hour
-            print("\nWaiting 1 hour for next check...")
-            next_check = datetime.now().replace(hour=(datetime.now().hour + 1) % 24, minute=0, second=0)
-            print(f"Next check at: {next_check.strftime('%H:%M:%S')}")
-
-            time.sleep(3600)  # 1 hour
+                    # Save to local log file (backup)
+                    save_to_log(weather_data, check_count, log_fp)
+                    logger.info("RabbitMQ not available, data saved locally only")
+
+            # Wait until the top of the next hour - an absolute deadline
+            # cannot drift the way a fixed sleep does, and rolls over
+            # midnight correctly. The wait is sliced so the idle AMQP
+            # connection gets its heartbeats serviced well within the
+            # 600s interval
+            next_check = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            print(f"\nNext check at: {next_check.strftime('%Y-%m-%d %H:%M:%S')}")
+            while not stop_evt.is_set():
+                remaining = (next_check - datetime.now()).total_seconds()
+                if remaining <= 0:
+                    break
+                stop_evt.wait(timeout=min(remaining, 60.0))
+                if rabbitmq_connected:
+                    publisher.heartbeat_tick()
 
-    except KeyboardInterrupt:
         print("\n\nWeather monitoring stopped by user")
         print(f"Total checks performed: {check_count}")
         print("Thank you for using Vienna Weather Monitor!")
 
     finally:
+        io_pool.shutdown(wait=True)
+
+        # Push buffered log lines to disk before shutting down
+        log_fp.flush()
+        os.fsync(log_fp.fileno())
+
         # Close RabbitMQ connection if it exists
         if rabbitmq_connected:
             publisher.close()